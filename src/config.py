@@ -36,12 +36,16 @@ class Settings(BaseSettings):
 # Global settings instance
 settings = Settings()
 
+# Derived from settings once, since they are fixed for the process lifetime
+LUMA_URL_PREFIX = f"{settings.luma_base_url}/{settings.luma_api_version}/"
+API_KEY_VALID = bool(settings.luma_api_key and settings.luma_api_key.strip())
+
 
 def get_luma_api_url(endpoint: str) -> str:
     """Construct full LUMA API URL for an endpoint."""
-    return f"{settings.luma_base_url}/{settings.luma_api_version}/{endpoint}"
+    return LUMA_URL_PREFIX + endpoint
 
 
 def validate_api_key() -> bool:
     """Validate that LUMA API key is configured."""
-    return bool(settings.luma_api_key and settings.luma_api_key.strip())
\ No newline at end of file
+    return API_KEY_VALID
\ No newline at end of file
@@ -0,0 +1,7 @@
+from fastapi import Request
+from src.luma_client import LumaClient
+
+
+async def get_luma_client(request: Request) -> LumaClient:
+    """Dependency to get the shared LUMA API client."""
+    return request.app.state.luma_client
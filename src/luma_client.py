@@ -1,11 +1,18 @@
 import asyncio
-from typing import Dict, Any, Optional
+import math
+import random
+from typing import Dict, Any, List, Optional
 import httpx
-from src.config import settings, get_luma_api_url, validate_api_key
+import orjson
+from src.config import settings, get_luma_api_url
 from src.models import APIError
 from src.utils.rate_limiter import rate_limit_request
 
 
+SUPPORTED_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+BODY_METHODS = frozenset({"POST", "PUT"})
+
+
 class LumaAPIError(Exception):
     """Custom exception for LUMA API errors."""
 
@@ -15,86 +22,104 @@ class LumaAPIError(Exception):
         self.response_data = response_data
 
 
+def _backoff_delay(retry_count: int, retry_after: Optional[str] = None) -> float:
+    """Return a jittered exponential backoff delay, honoring Retry-After when given."""
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            delay = -1.0  # HTTP-date form; fall back to our own backoff
+        if math.isfinite(delay) and delay >= 0:
+            return min(delay, 300) + random.uniform(0, 1)  # Max 5 minutes
+    base = min(settings.retry_backoff_factor ** retry_count, 300)  # Max 5 minutes
+    return random.uniform(0, base)
+
+
 class LumaClient:
     """Async client for LUMA API interactions."""
 
-    def __init__(self):
-        if not validate_api_key():
-            raise ValueError("LUMA_API_KEY environment variable is required")
-
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
+        # The API key is validated once at startup (see the app lifespan)
         self.api_key = settings.luma_api_key
         self.timeout = httpx.Timeout(settings.request_timeout_seconds)
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            transport=transport,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30
+            ),
+            headers={
+                "accept": "application/json",
+                "content-type": "application/json",
+                "x-luma-api-key": self.api_key
+            }
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "LumaClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
 
     async def _make_request(
         self,
         endpoint: str,
         method: str = "GET",
-        data: Optional[Dict[str, Any]] = None,
-        retry_count: int = 0
+        data: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Make an authenticated request to the LUMA API with rate limiting and retries."""
-        if retry_count > settings.max_retries:
-            raise LumaAPIError("Maximum retry attempts exceeded")
-        """Make an authenticated request to the LUMA API with rate limiting and retries."""
-
-        # Apply rate limiting
-        await rate_limit_request(endpoint, method)
-
-        headers = {
-            "accept": "application/json",
-            "content-type": "application/json",
-            "x-luma-api-key": self.api_key
-        }
+        method = method.upper()
+        if method not in SUPPORTED_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
 
         url = get_luma_api_url(endpoint)
+        request_kwargs: Dict[str, Any] = {}
+        if method in BODY_METHODS:
+            request_kwargs["json"] = data
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                if method.upper() == "GET":
-                    response = await client.get(url, headers=headers)
-                elif method.upper() == "POST":
-                    response = await client.post(url, headers=headers, json=data)
-                elif method.upper() == "PUT":
-                    response = await client.put(url, headers=headers, json=data)
-                elif method.upper() == "DELETE":
-                    response = await client.delete(url, headers=headers)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
-
-                # Handle rate limiting
-                if response.status_code == 429:
-                    if retry_count < settings.max_retries:
-                        # Wait with exponential backoff
-                        wait_time = min(settings.retry_backoff_factor ** retry_count, 300)  # Max 5 minutes
-                        await asyncio.sleep(wait_time)
-                        return await self._make_request(endpoint, method, data, retry_count + 1)
-                    else:
-                        raise LumaAPIError("Rate limit exceeded and max retries reached", 429)
-
-                # Handle other error responses
-                if not response.is_success:
-                    error_data = None
-                    try:
-                        error_data = response.json()
-                        error_msg = error_data.get("message", f"API Error: {response.status_code}")
-                    except:
-                        error_msg = f"API Error: {response.status_code}"
-
-                    raise LumaAPIError(error_msg, response.status_code, error_data)
-
-                return response.json()
+        for attempt in range(settings.max_retries + 1):
+            # Apply rate limiting
+            await rate_limit_request(endpoint, method)
 
+            try:
+                response = await self._client.request(method, url, **request_kwargs)
             except httpx.TimeoutException:
-                if retry_count < settings.max_retries:
-                    wait_time = min(settings.retry_backoff_factor ** retry_count, 300)  # Max 5 minutes
-                    await asyncio.sleep(wait_time)
-                    return await self._make_request(endpoint, method, data, retry_count + 1)
-                else:
-                    raise LumaAPIError("Request timeout and max retries reached")
-
+                if attempt < settings.max_retries:
+                    await asyncio.sleep(_backoff_delay(attempt))
+                    continue
+                raise LumaAPIError("Request timeout and max retries reached")
             except httpx.RequestError as e:
                 raise LumaAPIError(f"Request failed: {str(e)}")
 
+            # Handle rate limiting
+            if response.status_code == 429:
+                if attempt < settings.max_retries:
+                    # Wait with jittered exponential backoff
+                    await asyncio.sleep(_backoff_delay(attempt, response.headers.get("Retry-After")))
+                    continue
+                raise LumaAPIError("Rate limit exceeded and max retries reached", 429)
+
+            # Handle other error responses
+            if not response.is_success:
+                error_data = None
+                try:
+                    error_data = orjson.loads(response.content)
+                    error_msg = error_data.get("message", f"API Error: {response.status_code}")
+                except (orjson.JSONDecodeError, AttributeError):
+                    error_msg = f"API Error: {response.status_code}"
+
+                raise LumaAPIError(error_msg, response.status_code, error_data)
+
+            return orjson.loads(response.content)
+
+        raise LumaAPIError("Maximum retry attempts exceeded")
+
     # Event CRUD operations
     async def create_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new event."""
@@ -104,6 +129,10 @@ class LumaClient:
         """Get event details by ID."""
         return await self._make_request(f"event/get/{event_id}")
 
+    async def get_events_batch(self, event_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get several events concurrently over the shared connection pool."""
+        return list(await asyncio.gather(*(self.get_event(event_id) for event_id in event_ids)))
+
     async def update_event(self, event_id: str, event_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update an existing event."""
         return await self._make_request(f"event/update/{event_id}", "PUT", event_data)
@@ -2,6 +2,8 @@
 LUMA MCP Server - FastAPI application for managing LUMA events.
 """
 
+import platform
+import sys
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -9,10 +11,15 @@ from fastapi.responses import JSONResponse
 import uvicorn
 
 from src.config import settings, validate_api_key
-from src.luma_client import LumaAPIError
+from src.luma_client import LumaAPIError, LumaClient
 from src.routes.events import router as events_router
 from src.routes.templates import router as templates_router
 
+_UVLOOP_UNSUPPORTED = (
+    sys.platform in ("win32", "cygwin")
+    or platform.python_implementation() == "PyPy"
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -24,9 +31,11 @@ async def lifespan(app: FastAPI):
             "Please set it in your environment or .env file."
         )
 
+    app.state.luma_client = LumaClient()
+
     yield
     # Shutdown
-    pass
+    await app.state.luma_client.aclose()
 
 
 # Create FastAPI application
@@ -52,13 +61,11 @@ app.include_router(templates_router)
 
 
 @app.get("/health", summary="Health Check")
-async def health_check():
+async def health_check(request: Request):
     """Check if the service is healthy and can connect to LUMA API."""
     try:
         # Test API connectivity by getting user info
-        from src.luma_client import LumaClient
-        client = LumaClient()
-        await client.get_user_self()
+        await request.app.state.luma_client.get_user_self()
         return {"status": "healthy", "message": "LUMA API connection successful"}
     except Exception as e:
         return JSONResponse(
@@ -103,7 +110,11 @@ def main():
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
-        log_level="info"
+        log_level="info",
+        # uvicorn[standard] ships httptools everywhere, but uvloop only outside
+        # Windows, Cygwin and PyPy (mirrors its dependency marker)
+        loop="auto" if _UVLOOP_UNSUPPORTED else "uvloop",
+        http="httptools"
     )
 
 
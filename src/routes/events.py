@@ -1,19 +1,18 @@
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Depends
+from pydantic import TypeAdapter
+from src.deps import get_luma_client
 from src.luma_client import LumaClient, LumaAPIError
 from src.models import (
     EventCreateRequest,
     EventUpdateRequest,
-    EventResponse,
-    APIError
+    EventResponse
 )
 
 router = APIRouter(prefix="/events", tags=["events"])
 
-
-async def get_luma_client() -> LumaClient:
-    """Dependency to get LUMA API client."""
-    return LumaClient()
+# Validates a whole page of events in a single pydantic-core call
+_EVENT_LIST_ADAPTER = TypeAdapter(List[EventResponse])
 
 
 @router.post("/", response_model=EventResponse, summary="Create Event")
@@ -33,12 +32,12 @@ async def create_event(
     - **geo_address_json**: Location information (optional)
     """
     try:
-        result = await client.create_event(event.dict(exclude_unset=True))
-        return EventResponse(**result)
+        result = await client.create_event(event.model_dump(mode="json", exclude_unset=True))
+        return EventResponse.model_validate(result)
     except LumaAPIError as e:
         raise HTTPException(
             status_code=e.status_code or 500,
-            detail=APIError(error=str(e), code=str(e.status_code)).dict()
+            detail={"error": str(e), "code": str(e.status_code) if e.status_code else None}
         )
 
 
@@ -54,13 +53,13 @@ async def get_event(
     """
     try:
         result = await client.get_event(event_id)
-        return EventResponse(**result)
+        return EventResponse.model_validate(result)
     except LumaAPIError as e:
         if e.status_code == 404:
             raise HTTPException(status_code=404, detail="Event not found")
         raise HTTPException(
             status_code=e.status_code or 500,
-            detail=APIError(error=str(e), code=str(e.status_code)).dict()
+            detail={"error": str(e), "code": str(e.status_code) if e.status_code else None}
         )
 
 
@@ -79,15 +78,15 @@ async def update_event(
     try:
         result = await client.update_event(
             event_id,
-            event_update.dict(exclude_unset=True, exclude_none=True)
+            event_update.model_dump(mode="json", exclude_unset=True, exclude_none=True)
         )
-        return EventResponse(**result)
+        return EventResponse.model_validate(result)
     except LumaAPIError as e:
         if e.status_code == 404:
             raise HTTPException(status_code=404, detail="Event not found")
         raise HTTPException(
             status_code=e.status_code or 500,
-            detail=APIError(error=str(e), code=str(e.status_code)).dict()
+            detail={"error": str(e), "code": str(e.status_code) if e.status_code else None}
         )
 
 
@@ -109,7 +108,7 @@ async def delete_event(
             raise HTTPException(status_code=404, detail="Event not found")
         raise HTTPException(
             status_code=e.status_code or 500,
-            detail=APIError(error=str(e), code=str(e.status_code)).dict()
+            detail={"error": str(e), "code": str(e.status_code) if e.status_code else None}
         )
 
 
@@ -137,9 +136,9 @@ async def list_events(
         events = result.get("events", result) if isinstance(result, dict) else result
         if not isinstance(events, list):
             raise HTTPException(status_code=500, detail="Invalid response format from LUMA API")
-        return [EventResponse(**event) for event in events]
+        return _EVENT_LIST_ADAPTER.validate_python(events)
     except LumaAPIError as e:
         raise HTTPException(
             status_code=e.status_code or 500,
-            detail=APIError(error=str(e), code=str(e.status_code)).dict()
+            detail={"error": str(e), "code": str(e.status_code) if e.status_code else None}
         )
\ No newline at end of file
@@ -1,12 +1,14 @@
+from datetime import timedelta
 from typing import List
+import ciso8601
 from fastapi import APIRouter, HTTPException, Depends
+from src.deps import get_luma_client
 from src.luma_client import LumaClient, LumaAPIError
 from src.models import (
     EventTemplate,
     EventTemplateType,
     CreateFromTemplateRequest,
-    EventResponse,
-    APIError
+    EventResponse
 )
 
 router = APIRouter(prefix="/templates", tags=["templates"])
@@ -55,10 +57,15 @@ EVENT_TEMPLATES = {
     )
 }
 
+# Request models validate template types against the enum, so every member needs a template
+assert set(EVENT_TEMPLATES) == set(EventTemplateType), "EVENT_TEMPLATES must cover every EventTemplateType"
 
-async def get_luma_client() -> LumaClient:
-    """Dependency to get LUMA API client."""
-    return LumaClient()
+# Derived from EVENT_TEMPLATES once at import rather than per request
+_TEMPLATES_LIST = list(EVENT_TEMPLATES.values())
+_DURATION_DELTAS = {
+    template_type: timedelta(hours=template.default_duration_hours)
+    for template_type, template in EVENT_TEMPLATES.items()
+}
 
 
 @router.get("/", response_model=List[EventTemplate], summary="List Templates")
@@ -66,7 +73,7 @@ async def list_templates() -> List[EventTemplate]:
     """
     Get all available event templates.
     """
-    return list(EVENT_TEMPLATES.values())
+    return _TEMPLATES_LIST
 
 
 @router.get("/{template_type}", response_model=EventTemplate, summary="Get Template")
@@ -76,8 +83,6 @@ async def get_template(template_type: EventTemplateType) -> EventTemplate:
 
     - **template_type**: The type of template (meetup, workshop, conference, social_gathering, webinar)
     """
-    if template_type not in EVENT_TEMPLATES:
-        raise HTTPException(status_code=404, detail="Template not found")
     return EVENT_TEMPLATES[template_type]
 
 
@@ -96,16 +101,12 @@ async def create_from_template(
     - **meeting_url**: Meeting URL (for virtual events)
     - **geo_address_json**: Location information (for in-person events)
     """
-    if request.template_type not in EVENT_TEMPLATES:
-        raise HTTPException(status_code=404, detail="Template not found")
-
     template = EVENT_TEMPLATES[request.template_type]
 
     # Calculate end time based on template duration
-    from datetime import datetime, timedelta
     try:
-        start_time = datetime.fromisoformat(request.start_at.replace('Z', '+00:00'))
-        end_time = start_time + timedelta(hours=template.default_duration_hours)
+        start_time = ciso8601.parse_datetime(request.start_at)
+        end_time = start_time + _DURATION_DELTAS[request.template_type]
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"Invalid start_at format: {str(e)}")
 
@@ -122,13 +123,13 @@ async def create_from_template(
     if template.is_virtual and request.meeting_url:
         event_data["meeting_url"] = request.meeting_url
     elif not template.is_virtual and request.geo_address_json:
-        event_data["geo_address_json"] = request.geo_address_json.dict()
+        event_data["geo_address_json"] = request.geo_address_json.model_dump(mode="json")
 
     try:
         result = await client.create_event(event_data)
-        return EventResponse(**result)
+        return EventResponse.model_validate(result)
     except LumaAPIError as e:
         raise HTTPException(
             status_code=e.status_code or 500,
-            detail=APIError(error=str(e), code=str(e.status_code)).dict()
+            detail={"error": str(e), "code": str(e.status_code) if e.status_code else None}
         )
\ No newline at end of file
@@ -1,27 +1,25 @@
 import asyncio
+import re
 import time
-from collections import defaultdict
 from typing import Dict, Tuple
 from src.config import settings
 
+# (normalized endpoint, HTTP method)
+RateLimitKey = Tuple[str, str]
+
+# Endpoints such as "event/get/{event_id}" carry the ID as a trailing segment
+_ID_SEGMENT = re.compile(r"^([a-z-]+/(?:get|update|delete))/[^/]+$")
+
 
 class RateLimiter:
     """Simple rate limiter for LUMA API requests."""
 
     def __init__(self):
-        self.requests: Dict[str, list] = defaultdict(list)
-        self.blocked_until: Dict[str, float] = {}
-
-    def _clean_old_requests(self, key: str, window_seconds: int) -> None:
-        """Remove requests outside the current window."""
-        current_time = time.time()
-        cutoff_time = current_time - window_seconds
-        self.requests[key] = [
-            req_time for req_time in self.requests[key]
-            if req_time > cutoff_time
-        ]
+        # Fixed-window counters: key -> (window index, requests in that window)
+        self.counts: Dict[RateLimitKey, Tuple[int, int]] = {}
+        self.blocked_until: Dict[RateLimitKey, float] = {}
 
-    def _is_blocked(self, key: str) -> bool:
+    def _is_blocked(self, key: RateLimitKey) -> bool:
         """Check if a key is currently blocked."""
         current_time = time.time()
         if key in self.blocked_until:
@@ -31,59 +29,58 @@ class RateLimiter:
                 del self.blocked_until[key]
         return False
 
-    def can_make_request(self, key: str, max_requests: int, window_seconds: int) -> bool:
-        """Check if a request can be made for the given key."""
+    def try_acquire(self, key: RateLimitKey, max_requests: int, window_seconds: int) -> bool:
+        """Claim a request slot for the given key, returning False if none is free.
+
+        The check and the increment happen without an intervening await, so
+        concurrent tasks on the same event loop cannot over-admit.
+        """
         if self._is_blocked(key):
             return False
 
-        self._clean_old_requests(key, window_seconds)
-        return len(self.requests[key]) < max_requests
-
-    def record_request(self, key: str) -> None:
-        """Record a request for rate limiting."""
-        current_time = time.time()
-        self.requests[key].append(current_time)
+        window = int(time.time()) // window_seconds
+        counted_window, count = self.counts.get(key, (window, 0))
+        if counted_window != window:
+            count = 0
+        if count >= max_requests:
+            return False
+        self.counts[key] = (window, count + 1)
+        return True
 
-    def block_key(self, key: str, duration_seconds: int) -> None:
+    def block_key(self, key: RateLimitKey, duration_seconds: int) -> None:
         """Block a key for the specified duration."""
         self.blocked_until[key] = time.time() + duration_seconds
 
-    async def wait_if_needed(self, key: str, max_requests: int, window_seconds: int) -> None:
-        """Wait until a request can be made, with exponential backoff if blocked."""
-        wait_count = 0
-        max_total_wait = 600  # Max 10 minutes total wait time
-        while not self.can_make_request(key, max_requests, window_seconds):
-            if wait_count * 1 > max_total_wait:
-                raise Exception(f"Rate limiter timeout: waited too long for {key}")
-
-            if self._is_blocked(key):
-                # Exponential backoff for blocked keys
-                wait_time = min(settings.retry_backoff_factor ** len(self.requests[key]), 300)  # Max 5 minutes
-                await asyncio.sleep(wait_time)
+    async def acquire(self, key: RateLimitKey, max_requests: int, window_seconds: int) -> None:
+        """Claim a request slot, sleeping until the next free slot if needed."""
+        while not self.try_acquire(key, max_requests, window_seconds):
+            current_time = time.time()
+            if key in self.blocked_until:
+                resume_at = self.blocked_until[key]
             else:
-                # Wait for window to reset
-                await asyncio.sleep(1)
-            wait_count += 1
+                # Quota exhausted: the next slot opens when the window rolls over
+                resume_at = (int(current_time) // window_seconds + 1) * window_seconds
+            await asyncio.sleep(max(0, resume_at - current_time))
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """Collapse ID path segments so all requests to a route share one counter."""
+    return _ID_SEGMENT.sub(r"\1/*", endpoint)
+
 
+# Global rate limiter instance, shared across HTTP methods
+limiter = RateLimiter()
 
-# Global rate limiter instances
-get_limiter = RateLimiter()
-post_limiter = RateLimiter()
+# Per-method quotas; methods not listed fall back to the POST quota
+METHOD_QUOTAS = {
+    "GET": settings.rate_limit_get_requests,
+    "POST": settings.rate_limit_post_requests,
+}
 
 
 async def rate_limit_request(endpoint: str, method: str = "GET") -> None:
     """Apply rate limiting to a request."""
-    if method.upper() == "GET":
-        await get_limiter.wait_if_needed(
-            endpoint,
-            settings.rate_limit_get_requests,
-            settings.rate_limit_window_seconds
-        )
-        get_limiter.record_request(endpoint)
-    else:
-        await post_limiter.wait_if_needed(
-            endpoint,
-            settings.rate_limit_post_requests,
-            settings.rate_limit_window_seconds
-        )
-        post_limiter.record_request(endpoint)
\ No newline at end of file
+    method = method.upper()
+    key = (normalize_endpoint(endpoint), method)
+    max_requests = METHOD_QUOTAS.get(method, settings.rate_limit_post_requests)
+    await limiter.acquire(key, max_requests, settings.rate_limit_window_seconds)
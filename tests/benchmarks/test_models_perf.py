@@ -0,0 +1,59 @@
+import orjson
+import pytest
+from pydantic import TypeAdapter
+from src.models import (
+    EventCreateRequest,
+    EventResponse,
+    EventTemplate,
+    CreateFromTemplateRequest
+)
+from tests.test_models import (
+    CREATE_FROM_TEMPLATE_PAYLOAD,
+    EVENT_CREATE_PAYLOAD,
+    EVENT_RESPONSE_PAYLOAD,
+    GEO_ADDRESS_PAYLOAD,
+    TEMPLATE_PAYLOAD
+)
+
+pytest.importorskip("pytest_codspeed")
+
+# Larger variants of the model-test payloads, with every optional field set
+EVENT_CREATE_FULL = {
+    **EVENT_CREATE_PAYLOAD,
+    "end_at": "2024-12-31T20:00:00Z",
+    "require_rsvp_approval": True,
+    "meeting_url": "https://zoom.us/j/123456",
+    "geo_address_json": dict(GEO_ADDRESS_PAYLOAD)
+}
+
+EVENT_RESPONSE_FULL = {
+    **EVENT_RESPONSE_PAYLOAD,
+    "meeting_url": "https://zoom.us/j/123456",
+    "geo_address_json": dict(GEO_ADDRESS_PAYLOAD)
+}
+
+CREATE_FROM_TEMPLATE_FULL = {
+    **CREATE_FROM_TEMPLATE_PAYLOAD,
+    "geo_address_json": dict(GEO_ADDRESS_PAYLOAD)
+}
+
+# (model, payload) workloads; setup happens here so only validation is measured
+WORKLOADS = {
+    "event_create_minimal": (EventCreateRequest, dict(EVENT_CREATE_PAYLOAD)),
+    "event_create_full": (EventCreateRequest, EVENT_CREATE_FULL),
+    "event_response": (EventResponse, EVENT_RESPONSE_FULL),
+    "event_template": (EventTemplate, dict(TEMPLATE_PAYLOAD)),
+    "create_from_template": (CreateFromTemplateRequest, CREATE_FROM_TEMPLATE_FULL),
+}
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("workload", list(WORKLOADS))
+def test_validate_json(benchmark, workload):
+    """Benchmark validating a pre-encoded JSON payload into a model."""
+    model_cls, payload = WORKLOADS[workload]
+    adapter = TypeAdapter(model_cls)
+    data = orjson.dumps(payload)
+
+    result = benchmark(adapter.validate_json, data)
+    assert isinstance(result, model_cls)
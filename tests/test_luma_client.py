@@ -0,0 +1,126 @@
+import asyncio
+import httpx
+import pytest
+from src import luma_client
+from src.config import settings
+from src.luma_client import LumaAPIError, LumaClient
+
+HTTP_DATE = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff sleeps instead of waiting."""
+    recorded = []
+
+    async def fake_sleep(seconds):
+        recorded.append(seconds)
+
+    monkeypatch.setattr(luma_client.asyncio, "sleep", fake_sleep)
+    # Take the top of every jitter range so delays are deterministic
+    monkeypatch.setattr(luma_client.random, "uniform", lambda low, high: high)
+    return recorded
+
+
+def run_request(handler, endpoint="user/get-self", method="GET"):
+    """Run one LumaClient request against a mocked transport."""
+    async def go():
+        async with LumaClient(transport=httpx.MockTransport(handler)) as client:
+            return await client._make_request(endpoint, method)
+    return asyncio.run(go())
+
+
+class TestMakeRequest:
+    """Test LumaClient request dispatch and retries."""
+
+    def test_retries_after_429(self, sleeps):
+        """Test that a 429 followed by a 200 returns the body."""
+        responses = [httpx.Response(429), httpx.Response(200, json={"id": "usr-1"})]
+        assert run_request(lambda request: responses.pop(0)) == {"id": "usr-1"}
+        assert len(sleeps) == 1
+
+    def test_429_on_every_attempt_raises(self, sleeps):
+        """Test that persistent 429s stop after max_retries + 1 calls."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(429)
+
+        with pytest.raises(LumaAPIError) as exc_info:
+            run_request(handler)
+        assert exc_info.value.status_code == 429
+        assert len(calls) == settings.max_retries + 1
+        assert len(sleeps) == settings.max_retries
+
+    def test_timeout_on_every_attempt_raises(self, sleeps):
+        """Test that persistent timeouts raise the timeout error."""
+        def handler(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        with pytest.raises(LumaAPIError, match="Request timeout and max retries reached"):
+            run_request(handler)
+        assert len(sleeps) == settings.max_retries
+
+    def test_numeric_retry_after_sets_sleep(self, sleeps):
+        """Test that a numeric Retry-After drives the sleep duration."""
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "7"}),
+            httpx.Response(200, json={})
+        ]
+        run_request(lambda request: responses.pop(0))
+        assert sleeps == [7.0 + 1]  # Retry-After plus at most 1s of jitter
+
+    def test_http_date_retry_after_falls_back_to_backoff(self, sleeps):
+        """Test that an HTTP-date Retry-After uses the jittered backoff."""
+        responses = [
+            httpx.Response(429, headers={"Retry-After": HTTP_DATE}),
+            httpx.Response(429, headers={"Retry-After": HTTP_DATE}),
+            httpx.Response(200, json={})
+        ]
+        run_request(lambda request: responses.pop(0))
+        assert sleeps == [1.0, settings.retry_backoff_factor]
+
+    def test_retry_after_is_capped(self, sleeps):
+        """Test that oversized or non-finite Retry-After values are bounded."""
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "100000"}),
+            httpx.Response(429, headers={"Retry-After": "inf"}),
+            httpx.Response(200, json={})
+        ]
+        run_request(lambda request: responses.pop(0))
+        assert sleeps == [300 + 1, settings.retry_backoff_factor]
+
+
+class TestGetEventsBatch:
+    """Test concurrent event fetches."""
+
+    def test_results_follow_event_id_order(self):
+        """Test that results come back in the order the IDs were given."""
+        async def handler(request):
+            event_id = request.url.path.rsplit("/", 1)[-1]
+            # Finish later IDs first so completion order differs from input order
+            await asyncio.sleep(0.01 if event_id == "evt-a" else 0)
+            return httpx.Response(200, json={"id": event_id})
+
+        async def go():
+            async with LumaClient(transport=httpx.MockTransport(handler)) as client:
+                return await client.get_events_batch(["evt-a", "evt-b", "evt-c"])
+
+        assert asyncio.run(go()) == [{"id": "evt-a"}, {"id": "evt-b"}, {"id": "evt-c"}]
+
+    def test_error_for_one_id_propagates(self):
+        """Test that a failing event lookup raises LumaAPIError."""
+        def handler(request):
+            if request.url.path.endswith("/evt-missing"):
+                return httpx.Response(404, json={"message": "Event not found"})
+            return httpx.Response(200, json={"id": "evt-a"})
+
+        async def go():
+            async with LumaClient(transport=httpx.MockTransport(handler)) as client:
+                return await client.get_events_batch(["evt-a", "evt-missing"])
+
+        with pytest.raises(LumaAPIError) as exc_info:
+            asyncio.run(go())
+        assert exc_info.value.status_code == 404
+        assert str(exc_info.value) == "Event not found"
@@ -0,0 +1,64 @@
+import asyncio
+from src.utils import rate_limiter
+from src.utils.rate_limiter import RateLimiter, normalize_endpoint
+
+KEY = ("event/create", "POST")
+
+
+class TestRateLimiter:
+    """Test the fixed-window rate limiter."""
+
+    def test_allows_requests_up_to_limit(self, monkeypatch):
+        """Test that requests are admitted until the window quota is used."""
+        monkeypatch.setattr(rate_limiter.time, "time", lambda: 1000.0)
+        limiter = RateLimiter()
+        for _ in range(3):
+            assert limiter.try_acquire(KEY, 3, 60) is True
+        assert limiter.try_acquire(KEY, 3, 60) is False
+
+    def test_window_rollover_resets_count(self, monkeypatch):
+        """Test that the counter resets when a new window starts."""
+        now = [1000.0]
+        monkeypatch.setattr(rate_limiter.time, "time", lambda: now[0])
+        limiter = RateLimiter()
+        assert limiter.try_acquire(KEY, 1, 60) is True
+        assert limiter.try_acquire(KEY, 1, 60) is False
+
+        now[0] = 1020.0  # next 60s window starts at 1020
+        assert limiter.try_acquire(KEY, 1, 60) is True
+
+    def test_blocked_key(self, monkeypatch):
+        """Test that a blocked key is rejected until the block expires."""
+        now = [1000.0]
+        monkeypatch.setattr(rate_limiter.time, "time", lambda: now[0])
+        limiter = RateLimiter()
+        limiter.block_key(KEY, 30)
+        assert limiter.try_acquire(KEY, 10, 60) is False
+
+        now[0] = 1031.0
+        assert limiter.try_acquire(KEY, 10, 60) is True
+
+    def test_acquire_sleeps_until_window_rollover(self, monkeypatch):
+        """Test that acquiring sleeps once, exactly until the next window."""
+        now = [1000.0]
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        monkeypatch.setattr(rate_limiter.time, "time", lambda: now[0])
+        monkeypatch.setattr(rate_limiter.asyncio, "sleep", fake_sleep)
+        limiter = RateLimiter()
+        limiter.try_acquire(KEY, 1, 60)
+
+        asyncio.run(limiter.acquire(KEY, 1, 60))
+        assert sleeps == [20.0]
+        assert limiter.counts[KEY] == (17, 1)  # slot claimed in the new window
+
+    def test_normalize_endpoint(self):
+        """Test that event IDs collapse into a single route key."""
+        assert normalize_endpoint("event/get/evt-abc123") == "event/get/*"
+        assert normalize_endpoint("event/delete/evt-xyz") == "event/delete/*"
+        assert normalize_endpoint("event/create") == "event/create"
+        assert normalize_endpoint("user/get-self") == "user/get-self"